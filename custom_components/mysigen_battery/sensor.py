@@ -1,25 +1,65 @@
 """
 MySigen Battery Monitor - Pure YAML Platform
-No config entries, no coordinator - simple polling platform
+No config entries - one coordinator polls the API for all sensors
 """
 
+import asyncio
 import logging
-import requests
 import base64
+import random
 import time
 from datetime import timedelta
 from typing import Dict, Any, Optional
 
+import aiohttp
+import orjson
+
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.const import PERCENTAGE, UnitOfPower, UnitOfEnergy
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(seconds=30)
 
+# Circuit breaker: stop calling the API for a while after repeated failures
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60.0
+
+# Refresh the access token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 60.0
+
+# Sensors keep showing their last valid value for this long after it was
+# fetched, whether the API later omits the field or stops responding
+LAST_VALUE_MAX_AGE = 600.0
+
+# Tokens are trusted for this long if the API did not say when they expire
+TOKEN_CACHE_MAX_AGE = 3500
+
+STORAGE_KEY = "mysigen_battery"
+STORAGE_VERSION = 1
+
+# Per-request socket timeouts, in seconds
+CONNECT_TIMEOUT = 3.05
+READ_TIMEOUT = 10.0
+
+# Upper bound on one request including all retries, kept below SCAN_INTERVAL
+# and short enough that login + station lookup + first fetch fit in HA's
+# 60s platform setup limit
+REQUEST_DEADLINE = 15.0
+
+# 4xx statuses worth retrying; every 5xx is retried as well
+RETRY_STATUSES = (408, 429)
+
 # API URLs
 API_BASE = "https://api-aus.sigencloud.com"
 AUTH_URL = f"{API_BASE}/auth/oauth/token"
@@ -27,120 +67,344 @@ STATION_URL = f"{API_BASE}/device/owner/station/home"
 ENERGY_URL = f"{API_BASE}/device/sigen/station/energyflow/async"
 STATS_URL = f"{API_BASE}/data-process/sigen/station/statistics/gains"
 
+# Request headers that never change; only Sg-Ts and the bearer token vary
+BASE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "*/*",
+    "Origin": "https://app-aus.sigencloud.com",
+    "Referer": "https://app-aus.sigencloud.com/",
+    "Lang": "en_US",
+    "Sg-Bui": "1",
+    "Sg-Env": "1",
+    "Sg-Pkg": "sigen_app",
+    "Version": "RELEASE",
+    "Client-Server": "aus",
+    "Auth-Client-Id": "sigen",
+    "Sg-V": "3.4.0",
+}
+CLIENT_CREDS = base64.b64encode(b"sigen:sigen").decode("utf-8")
+LOGIN_HEADERS = {
+    **BASE_HEADERS,
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Authorization": f"Basic {CLIENT_CREDS}",
+}
+
+# (name, energy flow field) for each power sensor
+POWER_SENSORS = (
+    ("Battery Discharge Power", "batteryPower"),
+    ("Current PV Power", "pvPower"),
+    ("Current Grid Power", "buySellPower"),
+    ("Current Load Power", "loadPower"),
+)
+
+# (name, statistics field, state class) for each PV generation sensor
+ENERGY_SENSORS = (
+    ("Today PV Generation", "dayGeneration", SensorStateClass.TOTAL_INCREASING),
+    ("This Months PV Generation", "monthGeneration", SensorStateClass.TOTAL),
+    ("This Years PV Generation", "yearGeneration", SensorStateClass.TOTAL),
+    ("Lifetime PV Generation", "lifetimeGeneration", SensorStateClass.TOTAL_INCREASING),
+)
+
+
+def _ms_ts() -> str:
+    """Return the current Unix time in milliseconds, as the API expects it."""
+    return str(time.time_ns() // 1_000_000)
+
+
+def _api_payload(url: str, result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the data payload of an API response, or None if it reports an error."""
+    if result.get("code") == 0:
+        return result.get("data") or {}
+    _LOGGER.warning("Request to %s returned an error: %s", url, result.get("msg", result))
+    return None
+
 
 class MySigenData:
     """Shared data handler for all MySigen sensors."""
     
-    def __init__(self, username: str, password: str):
+    def __init__(self, hass: HomeAssistant, username: str, password: str):
         self.username = username
         self.password = password
         self.access_token = None
+        self._token_expiry = float("inf")
         self.station_id = None
-        self.data = {}
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "*/*",
-            "Origin": "https://app-aus.sigencloud.com",
-            "Referer": "https://app-aus.sigencloud.com/",
-            "Lang": "en_US",
-            "Sg-Bui": "1",
-            "Sg-Env": "1",
-            "Sg-Pkg": "sigen_app",
-            "Version": "RELEASE",
-            "Client-Server": "aus",
-        })
+        self._energy_params: Dict[str, Any] = {}
+        self._stats_params: Dict[str, Any] = {}
+        self.data: Dict[str, Dict[str, Any]] = {"energy_flow": {}, "statistics": {}}
+        self.fetched_at: Dict[str, float] = {"energy_flow": 0.0, "statistics": 0.0}
+        self._auth_lock = asyncio.Lock()
+        self._fail_count = 0
+        self._open_until = 0.0
+        self._session = async_get_clientsession(hass)
+        # Fail fast on unreachable hosts; allow the API longer to respond
+        self._timeout = aiohttp.ClientTimeout(
+            total=CONNECT_TIMEOUT + READ_TIMEOUT,
+            sock_connect=CONNECT_TIMEOUT,
+            sock_read=READ_TIMEOUT,
+        )
+        self._api_headers = BASE_HEADERS
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY, private=True)
+        self._token_acquired_at = 0.0
+        self._expires_in = None
     
-    def authenticate(self) -> bool:
+    def _set_token(self, token: str, expires_in: Optional[float], acquired_at: float):
+        """Install an access token and the headers that carry it."""
+        self.access_token = token
+        self._api_headers = {
+            **BASE_HEADERS,
+            "Authorization": f"Bearer {token}",
+            "TENANT-ID": "1",
+        }
+        self._token_acquired_at = acquired_at
+        self._expires_in = expires_in
+        lifetime = expires_in or TOKEN_CACHE_MAX_AGE
+        self._token_expiry = time.monotonic() + lifetime - (time.time() - acquired_at)
+    
+    async def async_load_token(self) -> bool:
+        """Restore a saved token and station ID, returning True if still usable."""
+        cached = await self._store.async_load()
+        if not cached or cached.get("username") != self.username:
+            return False
+        
+        max_age = cached.get("expires_in") or TOKEN_CACHE_MAX_AGE
+        if cached["token_acquired_at"] + max_age - time.time() <= TOKEN_REFRESH_MARGIN:
+            return False
+        
+        self._set_token(
+            cached["access_token"], cached.get("expires_in"), cached["token_acquired_at"]
+        )
+        if cached.get("station_id"):
+            self._set_station_id(cached["station_id"])
+        _LOGGER.info("MySigen restored saved access token")
+        return True
+    
+    def _set_station_id(self, station_id):
+        """Store the station ID and the query parameters built from it."""
+        self.station_id = station_id
+        self._energy_params = {"id": station_id, "refreshFlag": "true"}
+        self._stats_params = {"stationId": station_id}
+    
+    async def _async_save_token(self):
+        """Persist the current token and station ID for the next restart.
+        
+        A failed save is only logged; it never fails the login or fetch.
+        """
+        try:
+            await self._store.async_save({
+                "username": self.username,
+                "access_token": self.access_token,
+                "expires_in": self._expires_in,
+                "token_acquired_at": self._token_acquired_at,
+                "station_id": self.station_id,
+            })
+        except Exception as e:
+            _LOGGER.warning("Could not save MySigen token: %s", e)
+    
+    async def authenticate(self) -> bool:
         """Get access token."""
         try:
-            device_id = str(int(time.time() * 1000))
-            client_creds = base64.b64encode(b"sigen:sigen").decode("utf-8")
-            
-            headers = {
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Authorization": f"Basic {client_creds}",
-                "Auth-Client-Id": "sigen",
-                "Sg-V": "3.4.0",
-                "Sg-Ts": str(int(time.time() * 1000)),
-            }
+            ts = _ms_ts()
+            headers = {**LOGIN_HEADERS, "Sg-Ts": ts}
             
             data = {
                 "scope": "server",
                 "grant_type": "password",
-                "userDeviceId": device_id,
+                "userDeviceId": ts,
                 "username": self.username,
                 "password": self.password,
             }
             
-            response = self.session.post(AUTH_URL, data=data, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("code") == 0:
-                    self.access_token = result["data"]["access_token"]
-                    _LOGGER.info("MySigen authenticated successfully")
-                    return True
+            result = await self._request_with_retry("POST", AUTH_URL, data=data, headers=headers)
+            payload = _api_payload(AUTH_URL, result)
+            if payload is None:
+                # _api_payload has already logged the API's error message
+                return False
+            if payload.get("access_token"):
+                self._set_token(payload["access_token"], payload.get("expires_in"), time.time())
+                await self._async_save_token()
+                _LOGGER.info("MySigen authenticated successfully")
+                return True
             
-            _LOGGER.error("Auth failed: %s", response.text)
+            _LOGGER.error("Auth failed: response contained no access token")
             return False
             
         except Exception as e:
             _LOGGER.error("Auth error: %s", e)
             return False
     
-    def update(self):
-        """Fetch fresh data."""
-        if not self.access_token and not self.authenticate():
-            return
+    async def update(self) -> bool:
+        """Fetch fresh data, returning False if it failed or the breaker is open."""
+        if time.monotonic() < self._open_until:
+            return False
+        
+        if await self._fetch():
+            self._fail_count = 0
+            return True
+        
+        self._fail_count += 1
+        if self._fail_count >= BREAKER_THRESHOLD:
+            # Start the cooldown after the (possibly slow) failed fetch
+            self._open_until = time.monotonic() + BREAKER_COOLDOWN
+            _LOGGER.warning(
+                "MySigen API failed %d times in a row, pausing for %ds",
+                self._fail_count,
+                BREAKER_COOLDOWN,
+            )
+        return False
+    
+    @property
+    def breaker_open(self) -> bool:
+        """Return True while the circuit breaker is short-circuiting updates."""
+        return time.monotonic() < self._open_until
+    
+    async def _fetch(self) -> bool:
+        """Fetch energy flow and statistics from the API, returning success."""
+        token_stale = time.monotonic() > self._token_expiry - TOKEN_REFRESH_MARGIN
+        if (not self.access_token or token_stale) and not await self.authenticate():
+            return False
+        
+        # Get station info if needed
+        if not self.station_id:
+            station = await self._get_ok(STATION_URL)
+            if not station or not station.get("stationId"):
+                return False
+            self._set_station_id(station["stationId"])
+            await self._async_save_token()
         
+        # Get energy flow and statistics concurrently
+        energy, stats = await asyncio.gather(
+            self._get_ok(ENERGY_URL, self._energy_params),
+            self._get_ok(STATS_URL, self._stats_params),
+        )
+        now = time.monotonic()
+        if energy is not None:
+            self.data["energy_flow"] = energy
+            self.fetched_at["energy_flow"] = now
+        if stats is not None:
+            self.data["statistics"] = stats
+            self.fetched_at["statistics"] = now
+        return energy is not None or stats is not None
+    
+    async def _get_ok(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """GET an API endpoint and return its data payload, or None on failure."""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "TENANT-ID": "1",
-                "Auth-Client-Id": "sigen",
-                "Sg-V": "3.4.0",
-                "Sg-Ts": str(int(time.time() * 1000)),
-            }
-            
-            # Get station info if needed
-            if not self.station_id:
-                resp = self.session.get(STATION_URL, headers=headers, timeout=10)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    if data.get("code") == 0:
-                        self.station_id = str(data["data"]["stationId"])
-            
-            if not self.station_id:
-                return
-            
-            # Get energy flow
-            params = {"id": self.station_id, "refreshFlag": "true"}
-            resp = self.session.get(ENERGY_URL, headers=headers, params=params, timeout=10)
-            if resp.status_code == 200:
-                result = resp.json()
-                if result.get("code") == 0:
-                    self.data["energy_flow"] = result["data"]
-            
-            # Get statistics
-            params = {"stationId": self.station_id}
-            resp = self.session.get(STATS_URL, headers=headers, params=params, timeout=10)
-            if resp.status_code == 200:
-                result = resp.json()
-                if result.get("code") == 0:
-                    self.data["statistics"] = result["data"]
-                    
+            result = await self._fetch_json(url, params)
         except Exception as e:
-            _LOGGER.error("Update error: %s", e)
+            _LOGGER.warning("Request to %s failed: %s", url, e)
+            return None
+        return _api_payload(url, result)
+    
+    def _auth_headers(self) -> Dict[str, str]:
+        """Build headers for an authenticated API request."""
+        return {**self._api_headers, "Sg-Ts": _ms_ts()}
+    
+    async def _fetch_json(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """GET a URL and return the decoded JSON body, re-authenticating once on 401."""
+        token = self.access_token
+        try:
+            result = await self._request_with_retry(
+                "GET", url, headers=self._auth_headers(), params=params
+            )
+            if result.get("code") != 401:
+                return result
+        except aiohttp.ClientResponseError as e:
+            if e.status != 401:
+                raise
+        
+        # Token was rejected. A concurrent request may already have refreshed it.
+        async with self._auth_lock:
+            if self.access_token == token:
+                self.access_token = None
+                if not await self.authenticate():
+                    raise aiohttp.ClientError("Re-authentication failed")
+        return await self._request_with_retry(
+            "GET", url, headers=self._auth_headers(), params=params
+        )
+    
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        *,
+        max_retries: int = 3,
+        base: float = 1.0,
+        cap: float = 8.0,
+        deadline: float = REQUEST_DEADLINE,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Send a request, retrying transient failures with exponential backoff.
+        
+        All attempts and backoff sleeps together are bounded by deadline.
+        """
+        async with asyncio.timeout(deadline):
+            attempt = 0
+            while True:
+                try:
+                    async with self._session.request(
+                        method, url, timeout=self._timeout, **kwargs
+                    ) as resp:
+                        if resp.status < 500 and resp.status not in RETRY_STATUSES:
+                            # Success, or a client error that retrying won't fix
+                            resp.raise_for_status()
+                            return await resp.json(loads=orjson.loads, content_type=None)
+                        error = aiohttp.ClientResponseError(
+                            resp.request_info,
+                            resp.history,
+                            status=resp.status,
+                            message=resp.reason or "",
+                        )
+                except aiohttp.ClientResponseError:
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    error = e
+                
+                if attempt == max_retries:
+                    raise error
+                
+                delay = min(cap, base * 2 ** attempt) * (1 + random.random() * 0.5)
+                _LOGGER.debug("Request to %s failed (%s), retrying in %.1fs", url, error, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+
+class MySigenCoordinator(DataUpdateCoordinator):
+    """Coordinator that fetches MySigen data once per interval for all sensors."""
+    
+    def __init__(self, hass: HomeAssistant, data_handler: MySigenData):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="mysigen_battery",
+            update_interval=SCAN_INTERVAL,
+        )
+        self.data_handler = data_handler
+    
+    async def _async_update_data(self) -> Dict[str, Any]:
+        """Fetch data, serving the cache on failure until it is too old."""
+        handler = self.data_handler
+        if await handler.update():
+            return handler.data
+        
+        # Keep sensors (and the breaker attribute) available on cached data for
+        # a while, then mark them unavailable rather than show frozen readings
+        if time.monotonic() - max(handler.fetched_at.values()) < LAST_VALUE_MAX_AGE:
+            return handler.data
+        if handler.breaker_open:
+            raise UpdateFailed("MySigen API paused after repeated failures")
+        raise UpdateFailed("Failed to fetch data from MySigen API")
 
 
-def setup_platform(
+async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
-    add_entities: AddEntitiesCallback,
+    async_add_entities: AddEntitiesCallback,
     discovery_info: Optional[DiscoveryInfoType] = None,
 ) -> None:
-    """Set up MySigen sensors (SYNC version to avoid config entry)."""
+    """Set up MySigen sensors (YAML platform, no config entry)."""
     
     username = config.get("username")
     password = config.get("password")
@@ -150,38 +414,40 @@ def setup_platform(
         return
     
     # Create shared data handler
-    data_handler = MySigenData(username, password)
+    data_handler = MySigenData(hass, username, password)
     
-    # Authenticate
-    if not data_handler.authenticate():
+    # Reuse the token from the last run if it is still valid, else authenticate
+    if not await data_handler.async_load_token() and not await data_handler.authenticate():
         _LOGGER.error("Authentication failed")
         return
     
     # Initial update
-    data_handler.update()
+    coordinator = MySigenCoordinator(hass, data_handler)
+    await coordinator.async_refresh()
     
     # Create sensors
     sensors = [
-        MySigenBatterySoC(data_handler),
-        MySigenBatteryPower(data_handler),
-        MySigenPVPower(data_handler),
-        MySigenGridPower(data_handler),
-        MySigenLoadPower(data_handler),
-        MySigenDayGeneration(data_handler),
-        MySigenMonthGeneration(data_handler),
-        MySigenYearGeneration(data_handler),
-        MySigenLifetimeGeneration(data_handler),
+        MySigenBatterySoC(coordinator),
+        *(MySigenPowerSensor(coordinator, *row) for row in POWER_SENSORS),
+        *(MySigenEnergySensor(coordinator, *row) for row in ENERGY_SENSORS),
     ]
     
-    add_entities(sensors, True)
+    async_add_entities(sensors)
     _LOGGER.info("MySigen: Loaded %d sensors", len(sensors))
 
 
-class MySigenSensor(SensorEntity):
+class MySigenSensor(CoordinatorEntity, SensorEntity):
     """Base MySigen sensor."""
     
-    def __init__(self, data_handler: MySigenData, name: str):
-        self._data_handler = data_handler
+    def __init__(
+        self, coordinator: MySigenCoordinator, name: str, source: str, key: str
+    ):
+        super().__init__(coordinator)
+        self._data_handler = coordinator.data_handler
+        self._source = source  # "energy_flow" or "statistics" payload
+        self._key = key
+        self._last_valid_value = None  # Store last known value
+        self._last_valid_at = 0.0
         self._attr_name = f"MySigen {name}"
         self._attr_unique_id = f"mysigen_battery_{name.lower().replace(' ', '_')}"
         
@@ -193,154 +459,55 @@ class MySigenSensor(SensorEntity):
             "model": "Battery System",
         }
     
-    def update(self):
-        """Update sensor."""
-        self._data_handler.update()
-
-
-class MySigenBatterySoC(MySigenSensor):
-    """Battery SoC sensor."""
-    
-    def __init__(self, data_handler):
-        super().__init__(data_handler, "Battery SoC")
-        self._attr_native_unit_of_measurement = PERCENTAGE
-        self._attr_device_class = SensorDeviceClass.BATTERY
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._last_valid_value = None  # Store last known value
-    
     @property
-    def native_value(self):
-        """Return battery SoC, keeping last value if API returns None."""
-        current_value = self._data_handler.data.get("energy_flow", {}).get("batterySoc")
-        
-        # If we got a valid value, store it
-        if current_value is not None:
-            self._last_valid_value = current_value
-            return current_value
-        
-        # If API returns None but we have a previous value, keep showing it
-        return self._last_valid_value
-
-
-class MySigenBatteryPower(MySigenSensor):
-    """Battery power sensor."""
-    
-    def __init__(self, data_handler):
-        super().__init__(data_handler, "Battery Discharge Power")
-        self._attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-        self._attr_device_class = SensorDeviceClass.POWER
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Expose circuit breaker state for diagnostics."""
+        return {"api_circuit_open": self._data_handler.breaker_open}
     
     @property
     def native_value(self):
-        power = self._data_handler.data.get("energy_flow", {}).get("batteryPower")
-        if power is not None:
-            return round(power / 1000, 2) if abs(power) > 100 else power
-        return None
-
-
-class MySigenPVPower(MySigenSensor):
-    """PV power sensor."""
+        return self._resolve(self.coordinator.data[self._source].get(self._key))
     
-    def __init__(self, data_handler):
-        super().__init__(data_handler, "Current PV Power")
-        self._attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-        self._attr_device_class = SensorDeviceClass.POWER
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-    
-    @property
-    def native_value(self):
-        power = self._data_handler.data.get("energy_flow", {}).get("pvPower")
-        if power is not None:
-            return round(power / 1000, 2) if abs(power) > 100 else power
+    def _resolve(self, value):
+        """Return value, or the last valid one, while it was fetched recently enough."""
+        # If we got a valid value, store it along with when it was fetched
+        if value is not None:
+            self._last_valid_value = value
+            self._last_valid_at = self._data_handler.fetched_at[self._source]
+        
+        # Keep showing it until it is older than the cap, even if never replaced
+        if time.monotonic() - self._last_valid_at < LAST_VALUE_MAX_AGE:
+            return self._last_valid_value
         return None
 
 
-class MySigenGridPower(MySigenSensor):
-    """Grid power sensor."""
+class MySigenBatterySoC(MySigenSensor):
+    """Battery SoC sensor."""
     
-    def __init__(self, data_handler):
-        super().__init__(data_handler, "Current Grid Power")
-        self._attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
-        self._attr_device_class = SensorDeviceClass.POWER
+    def __init__(self, coordinator):
+        super().__init__(coordinator, "Battery SoC", "energy_flow", "batterySoc")
+        self._attr_native_unit_of_measurement = PERCENTAGE
+        self._attr_device_class = SensorDeviceClass.BATTERY
         self._attr_state_class = SensorStateClass.MEASUREMENT
-    
-    @property
-    def native_value(self):
-        power = self._data_handler.data.get("energy_flow", {}).get("buySellPower")
-        if power is not None:
-            return round(power / 1000, 2) if abs(power) > 100 else power
-        return None
 
 
-class MySigenLoadPower(MySigenSensor):
-    """Load power sensor."""
+class MySigenPowerSensor(MySigenSensor):
+    """Power sensor backed by an energy flow field."""
     
-    def __init__(self, data_handler):
-        super().__init__(data_handler, "Current Load Power")
+    def __init__(self, coordinator, name, key):
+        super().__init__(coordinator, name, "energy_flow", key)
         self._attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
+        self._attr_suggested_display_precision = 2
         self._attr_device_class = SensorDeviceClass.POWER
         self._attr_state_class = SensorStateClass.MEASUREMENT
-    
-    @property
-    def native_value(self):
-        power = self._data_handler.data.get("energy_flow", {}).get("loadPower")
-        if power is not None:
-            return round(power / 1000, 2) if abs(power) > 100 else power
-        return None
-
-
-class MySigenDayGeneration(MySigenSensor):
-    """Day generation sensor."""
-    
-    def __init__(self, data_handler):
-        super().__init__(data_handler, "Today PV Generation")
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-    
-    @property
-    def native_value(self):
-        return self._data_handler.data.get("statistics", {}).get("dayGeneration")
 
 
-class MySigenMonthGeneration(MySigenSensor):
-    """Month generation sensor."""
+class MySigenEnergySensor(MySigenSensor):
+    """PV generation sensor backed by a statistics field."""
     
-    def __init__(self, data_handler):
-        super().__init__(data_handler, "This Months PV Generation")
+    def __init__(self, coordinator, name, key, state_class):
+        super().__init__(coordinator, name, "statistics", key)
         self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
         self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL
-    
-    @property
-    def native_value(self):
-        return self._data_handler.data.get("statistics", {}).get("monthGeneration")
+        self._attr_state_class = state_class
 
-
-class MySigenYearGeneration(MySigenSensor):
-    """Year generation sensor."""
-    
-    def __init__(self, data_handler):
-        super().__init__(data_handler, "This Years PV Generation")
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL
-    
-    @property
-    def native_value(self):
-        return self._data_handler.data.get("statistics", {}).get("yearGeneration")
-
-
-class MySigenLifetimeGeneration(MySigenSensor):
-    """Lifetime generation sensor."""
-    
-    def __init__(self, data_handler):
-        super().__init__(data_handler, "Lifetime PV Generation")
-        self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
-        self._attr_device_class = SensorDeviceClass.ENERGY
-        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-    
-    @property
-    def native_value(self):
-        return self._data_handler.data.get("statistics", {}).get("lifetimeGeneration")
\ No newline at end of file